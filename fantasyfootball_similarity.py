@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from scipy.spatial.distance import cdist
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import seaborn as sns
 import math
 import os
+import tempfile
+
+try:
+    from similarity_kernels import euclid_block
+except ImportError: #Numba is optional, fall back to the NumPy distance
+    euclid_block = None
 
 pd.options.mode.chained_assignment = None  # default='warn'
 
@@ -14,21 +16,98 @@ st.set_page_config(page_title="Fantasy Football Player Similarity", page_icon="
 st.title('Fantasy Football Player Similarity')
 
 #Load Data
-def load_season_data():
-    data = pd.read_csv('data/old_scraping/Season_Stats_2000_22.csv')
+def read_table(path):
+    #Prefer a Parquet snapshot next to the CSV, it decodes much faster with typed columns
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+        try:
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+        except Exception: #Unreadable snapshot, rebuild it from the CSV
+            pass
+    #Multithreaded Arrow CSV parser when pyarrow is installed
+    try:
+        data = pd.read_csv(path, engine='pyarrow')
+    except ImportError:
+        data = pd.read_csv(path)
+    #Write the snapshot to a temp file and swap it in, so a crash or a concurrent load never leaves a partial one
+    #Skip it without pyarrow or a writable data folder
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix='.parquet', dir=os.path.dirname(parquet_path))
+        os.close(fd)
+        data.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o777) #mkstemp files are owner-only, match the CSV
+        os.replace(tmp_path, parquet_path)
+    except (ImportError, OSError):
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return data
+
+def to_category(data, cols):
+    #Store repeated labels as ordered categoricals so filters and groupbys run on integer codes
+    for col in cols:
+        data[col] = data[col].astype(pd.CategoricalDtype(np.sort(data[col].unique()), ordered=True))
     return data
 
+@st.cache_data(show_spinner=False)
+def load_season_data():
+    data = read_table('data/old_scraping/Season_Stats_2000_22.csv')
+    #Single precision is plenty for the distance features and halves their memory traffic
+    scaled = data.columns[data.columns.str.endswith('_Scaled')]
+    data[scaled] = data[scaled].astype(np.float32)
+    #Ages and season point totals are small whole numbers
+    data = data.astype({'Age': np.int8, 'Fantasy_Points': np.int16})
+    return to_category(data, ['Player', 'Pos', 'Season'])
+
+@st.cache_data(show_spinner=False)
 def load_draft_data():
-    data = pd.read_csv('data/old_scraping/1994_to_2022_draftclass.csv')
+    data = read_table('data/old_scraping/1994_to_2022_draftclass.csv')
+    return to_category(data, ['Player', 'Pos', 'Season'])
+
+@st.cache_data(show_spinner=False)
+def get_prepared_season():
+    data = load_season_data()
+    #Create a Position Rank columns by Season
+    data['Pos_Rank'] = data.groupby(['Pos', 'Season'], observed=True)['Fantasy_Points'].rank(ascending = False, method = 'min')
     return data
 
+@st.cache_data(show_spinner=False)
+def compute_draft_avg():
+    #Calculate the average number of players drafted for each position
+    draft = load_draft_data()
+    agg = draft.groupby(by = ['Season', 'Pos'], as_index=False, observed=True).count()
+    return agg.groupby('Pos', observed=True)['Player'].mean().round(0).to_dict()
+
+@st.cache_data(show_spinner=False)
+def get_player_rows():
+    #Row positions of every player's seasons, so lookups skip a full column scan
+    return get_prepared_season().groupby('Player', observed=True).indices
+
+@st.cache_resource(show_spinner=False)
+def warm_kernels():
+    #Compile the distance kernel once per process so the first analysis skips the JIT
+    if euclid_block is not None:
+        X = np.zeros((1, 1), dtype=np.float32)
+        euclid_block(X, X, np.zeros(1, dtype=np.intp))
+
+@st.cache_data(show_spinner=False)
+def get_latest_season():
+    return int(get_prepared_season()['Season'].max())
+
+@st.cache_data(show_spinner=False)
+def get_unique_players():
+    return tuple(get_prepared_season()['Player'].unique())
+
 #data_load_state = st.text('Loading data...')
-season_df = load_season_data()
+season_df = get_prepared_season()
 draft_df = load_draft_data()
-#Create a Position Rank columns by Season
-season_df['Pos_Rank'] = season_df.groupby(['Pos', 'Season'])['Fantasy_Points'].rank(ascending = False, method = 'min')
+draft_avg = compute_draft_avg()
+player_rows = get_player_rows()
+latest_season = get_latest_season()
+warm_kernels()
 
-unique_players = season_df['Player'].unique()
+unique_players = get_unique_players()
+scaled_cols = season_df.columns[season_df.columns.str.endswith('_Scaled')].tolist()
 
 
 ##############################################################
@@ -36,90 +115,76 @@ unique_players = season_df['Player'].unique()
 ##############################################################
 
 
-def euclid_rank(df, target_player, age):
-    target = df.loc[df.Player == target_player]
-    non = df.loc[df.Player != target_player]
-    #Extract Feature Data
-    ret_target = target.loc[:, target.columns.str.endswith("_Scaled")]
-    ret_non = non.loc[:, target.columns.str.endswith("_Scaled")]
-    #Calculate Euclidian Distance
-    euclid = cdist(ret_non, ret_target,  'euclid')
-    euclid = euclid.round(decimals=2)
-    names = non.Player
-    string = 'Age_{}'.format(str(age))
-    col = [string]
-    df = pd.DataFrame(data = euclid, index=names, columns = col)
-    return df
+def euclid_rank(X, Y, col):
+    #Calculate Euclidian Distance between every row of X and its target row Y[col]
+    if euclid_block is not None:
+        euclid = euclid_block(X, Y, col)
+    else:
+        #||x||² + ||y||² - 2xy for all pairs, then keep each row's own target
+        xx = np.einsum('ij,ij->i', X, X)
+        yy = np.einsum('ij,ij->i', Y, Y)
+        euclid = np.sqrt(np.maximum(xx[:, None] + yy[None, :] - 2 * X @ Y.T, 0.0))[np.arange(col.size), col]
+    return euclid
 
 def euclid_compare(peer_df, target):
     
-    #Create list of Age ranges
-    age_range = []
-    
-    #For Loop to Create Individual Dataframes of all unique ages
-    for i in peer_df.Age.unique():
-        a = int(i) 
-        age_range.append(a)
-        name = 'Age_'+str(a)
-        vars()[name] = peer_df.loc[peer_df.Age == i]
-        #Run euclid rank
-        euclid_name = 'euclid_'+str(a)
-        vars()[euclid_name] = euclid_rank(df = vars()[name], target_player = target, age = a)
+    #Extract Feature Data
+    feat = peer_df[scaled_cols].to_numpy()
+    ages = peer_df['Age'].to_numpy()
+    players = peer_df['Player'].to_numpy()
+    tgt = players == target
     
-    age_range.sort()
-    x = min(age_range)
-    df_name = 'euclid_' +str(x)
-    base_df = vars()[df_name]
-
-    age_range_mod = age_range[1:]
+    #Create list of Age ranges from the target's seasons
+    order = np.argsort(ages[tgt])
+    age_range = ages[tgt][order]
     
-    #Join all age dfs
-    for i in age_range_mod:
-        name = 'euclid_' +str(i)
-        base_df = pd.merge(base_df, vars()[name], how = 'inner', on = 'Player')
-    #Return Result
-    else:
-        base_df['Avg'] = round(base_df.mean(axis=1),2)
-        return base_df.sort_values(by = 'Avg', ascending = True)
+    #Run euclid rank for all ages at once and keep each peer's distance at its own age
+    peers = ~tgt & np.isin(ages, age_range)
+    col = np.searchsorted(age_range, ages[peers])
+    euclid = euclid_rank(feat[peers], feat[tgt][order], col)
+    peer_names = players[peers]
     
-def draft_position(output_df, draft_df, target):
+    #Scatter into a players x ages matrix, rows keyed by the peers at the first age
+    names = pd.Index(peer_names[col == 0], name='Player')
+    rows = names.get_indexer(peer_names)
+    found = rows >= 0
+    out = np.full((len(names), len(age_range)), np.nan)
+    out[rows[found], col[found]] = euclid[found]
     
-    name_list = []
+    #Keep players seen at every age (inner join)
+    complete = ~np.isnan(out).any(axis=1)
+    base_df = pd.DataFrame(out[complete], index=names[complete], columns=['Age_'+str(int(a)) for a in age_range])
+    base_df['Avg'] = out[complete].mean(axis=1)
+    return base_df.sort_values(by = 'Avg', ascending = True)
     
-    for i in output_df.index:
-        name_list.append(i)
+def draft_position(output_df, draft_df, target):
     
-    name_list.append(target)
-    #Filter for output players
-    peer_draft = draft_df.loc[draft_df.Player.isin(name_list)]
+    #Filter for output players and the target
+    name_arr = np.append(output_df.index.to_numpy(), target)
+    peer_draft = draft_df.loc[draft_df['Player'].isin(name_arr)]
     
     return peer_draft
 
-def draft_similarity(peer_draft, draft_df):
+def draft_similarity(peer_draft, draft_avg):
     #Identify the Target Player's draft position
-    target_draft = peer_draft.loc[peer_draft.Player == target].iloc[0]
+    pick = peer_draft['Pick'].to_numpy()
+    pos_pick = peer_draft['Position_Pick'].to_numpy()
+    tgt = peer_draft['Player'].to_numpy() == target
+    tgt_pick, tgt_pos_pick = pick[tgt][0], pos_pick[tgt][0]
     
-    #Calculate the Abs. Pick Difference
-    peer_draft.loc[:,'Pick_Diff_Abs'] = abs(peer_draft['Pick'] - target_draft['Pick'])
-    peer_draft.loc[:,'Pos_Pick_Diff_Abs'] = abs(peer_draft['Position_Pick'] - target_draft['Position_Pick'])
-    peer_draft.loc[:,'Pick_Diff_Weight'] = round(1-peer_draft['Pick_Diff_Abs']/(32*7),2) #Total Picks
-    
-    #Calculate the average number of players drafted for each position
-    agg = draft_df.groupby(by = ['Season', 'Pos'], as_index=False).count()
-    agg = agg.groupby('Pos').mean()
-    agg['Avg_Players_Drafted'] = round(agg['Player'],0)
-    draft_avg = agg['Avg_Players_Drafted']
-    #draft_avg
+    #Calculate the Abs. Pick Difference weight
+    pick_w = 1 - np.abs(pick - tgt_pick)/(32*7) #Total Picks
     
     #Calculate the Positional Pick Difference
     position = peer_draft.Pos.mode()[0]
-    Pos_Pick_Num = draft_avg.loc[draft_avg.index == position][0]
-    peer_draft.loc[:,'Pos_Pick_Diff_Weight'] = round(1-peer_draft['Pos_Pick_Diff_Abs']/(Pos_Pick_Num),2) #Number of Players in the Position
-    peer_draft.loc[:,'Pick_Score'] = round((peer_draft['Pos_Pick_Diff_Weight'] + peer_draft['Pick_Diff_Weight'])/2,2)
-    peer_draft.sort_values(by = 'Pick_Score', ascending = False, inplace = True)
-    peer_score = peer_draft[['Player', 'Pick_Score']]
-    peer_score.set_index('Player', inplace=True)
-    return peer_score.applymap(lambda x: max(0, x))
+    Pos_Pick_Num = draft_avg[position]
+    pos_w = 1 - np.abs(pos_pick - tgt_pos_pick)/Pos_Pick_Num #Number of Players in the Position
+    score = np.clip((pos_w + pick_w)/2, 0, None)
+    
+    #Keep the best Pick Score for players sharing a name
+    peer_score = pd.DataFrame({'Pick_Score': score}, index=pd.Index(peer_draft['Player'].to_numpy(), name='Player'))
+    peer_score = peer_score.sort_values(by = 'Pick_Score', ascending = False)
+    return peer_score.groupby(level=0, sort=False).first()
 
 def draft_score_weighting(output_df, peer_score):
     #Weight the Pick Score based on the number of seasons played
@@ -127,16 +192,16 @@ def draft_score_weighting(output_df, peer_score):
 
     #Divide Pick Score to Similarity Score - Weighted by the seasons played
     #The longer they've played, the impact the draft similarity has on the result
-    peer_score_similarity = round(output_df.div(output_df.join(peer_score)['Pick_Score'], axis=0),2)
-    output_df2 = round((output_df*seasons_played + peer_score_similarity)/(seasons_played+1),2)
+    peer_score_similarity = output_df.div(output_df.join(peer_score)['Pick_Score'], axis=0)
+    output_df2 = (output_df*seasons_played + peer_score_similarity)/(seasons_played+1)
     output_df2.sort_values(by = 'Avg', ascending = True, inplace = True)
     #output_df2.reset_index(inplace=True)
     return output_df2
 
-def calculate_similarities(target, output_df, draft_df):
+def calculate_similarities(target, output_df, draft_df, draft_avg):
     #Add the Draft Similarity Scores
     peer_draft = draft_position(output_df, draft_df, target)
-    peer_score = draft_similarity(peer_draft, draft_df)
+    peer_score = draft_similarity(peer_draft, draft_avg)
     final_output = draft_score_weighting(output_df, peer_score)
     final_output.dropna(subset=['Avg'], inplace=True)
     final_output = final_output.loc[final_output.Avg < 1]
@@ -146,24 +211,23 @@ def calculate_similarities(target, output_df, draft_df):
 ################ Pt.2: Projection Functions ##################
 ##############################################################
 
-def projection_stats(target, output, season_df):
+def projection_stats(target, output, season_df, player_rows):
     player_list = [target] + output.index.tolist()  # Get similar players including the target
 
     # Look at the performances of the players in subsequent seasons
     projection_stats = season_df[season_df['Player'].isin(player_list)]
-    projection_stats = projection_stats[projection_stats['Age'] > season_df[season_df['Player'] == target]['Age'].min()]
+    projection_stats = projection_stats[projection_stats['Age'] > season_df.take(player_rows[target])['Age'].min()]
 
     # Group and then pivot the data
-    grouped_stats = projection_stats.groupby(['Player', 'Age'])['Fantasy_Points'].mean().reset_index()
+    grouped_stats = projection_stats.groupby(['Player', 'Age'], observed=True)['Fantasy_Points'].mean().reset_index()
     proj_points = grouped_stats.pivot(index='Player', columns='Age', values='Fantasy_Points')
 
     return proj_points
 
-def point_bucket(target, season_df):
+def point_bucket(target, season_df, player_rows, latest_season):
     #Attach Rankings to Point Buckets
-    position = season_df.loc[season_df.Player == target].Pos.min()
-    latest = season_df.Season.max()
-    latest_season_df = season_df.loc[(season_df.Season == latest) & (season_df.Pos == position)]
+    position = season_df.take(player_rows[target]).Pos.min()
+    latest_season_df = season_df.loc[(season_df.Season == latest_season) & (season_df.Pos == position)]
 
     point_max = int(latest_season_df.Fantasy_Points.max())
     ceiling = (math.ceil(point_max / 50) * 50)+1
@@ -177,7 +241,18 @@ def point_bucket(target, season_df):
     points_df['Avg_Rank'] = round(avg_rank_df['Pos_Rank'],1)
     return points_df.dropna()
 
+def weighted_quantiles(values, weights, q):
+    #Quantiles where each value counts with its weight (inverted CDF), no row repetition needed
+    order = np.argsort(values)
+    values, cum = values[order], np.cumsum(weights[order])
+    idx = np.searchsorted(cum, np.asarray(q) * cum[-1], side='left')
+    return values[np.minimum(idx, len(values) - 1)]
+
 def visualize_projections(proj_points, output):
+    #Plotting is only needed once an analysis runs, keep matplotlib off the startup path
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     #Remove columns (ages) where there is insufficient data
     zero_col = None
     for col in proj_points.columns:
@@ -189,24 +264,34 @@ def visualize_projections(proj_points, output):
     if zero_col is not None:
         proj_points = proj_points.loc[:, :zero_col]
 
-    #Repeat the weights as row numbers
-    output2 = output.copy()
-    output2['Avg'] = 1 - output2['Avg']  # Assuming you want to transform the scores
-
-    # Ensure the index of 'output2' and 'proj_points' are aligned before assignment
-    proj_points = proj_points.loc[output2.index]  # This aligns 'proj_points' to the index of 'output2'
-    proj_points['Weight'] = output2['Avg']
-        
-    weighted_proj_points = proj_points.loc[np.repeat(proj_points.index.values, proj_points['Weight'])]
-    weighted_proj_points.drop(columns = 'Weight', inplace = True)
-    weighted_proj_points = weighted_proj_points[weighted_proj_points != 0]
+    #Weight each similar player by 1 - Avg and align to the projection rows
+    proj_points = proj_points.reindex(output.index)
+    weights = (1 - output['Avg']).clip(lower=0).to_numpy()
+
+    #Weighted box statistics per age, ignoring seasons with no points
+    stats = []
+    for col in proj_points.columns:
+        vals = proj_points[col].to_numpy(dtype=float)
+        keep = ~np.isnan(vals) & (vals != 0) & (weights > 0)
+        if not keep.any():
+            continue
+        vals = vals[keep]
+        q1, med, q3 = weighted_quantiles(vals, weights[keep], [0.25, 0.5, 0.75])
+        #Whiskers reach the furthest seasons within 1.5 IQR of the box like seaborn's default, the rest are outliers
+        iqr = q3 - q1
+        inside = (vals >= q1 - 1.5 * iqr) & (vals <= q3 + 1.5 * iqr)
+        stats.append({'label': col, 'whislo': vals[inside].min(), 'q1': q1, 'med': med, 'q3': q3,
+                      'whishi': vals[inside].max(), 'fliers': vals[~inside]})
     
     #Create Box Plot
-    point_map = point_bucket(target = target, season_df = season_df)
-    sns.set_style("whitegrid")
-    #ax = 
-    sns.boxplot(data=weighted_proj_points, palette="Set2")
+    point_map = point_bucket(target = target, season_df = season_df, player_rows = player_rows, latest_season = latest_season)
+    plt.style.use('seaborn-v0_8-whitegrid')
     ax = plt.gca()
+    if stats:
+        boxes = ax.bxp(stats, positions=range(len(stats)), patch_artist=True, flierprops={'marker': 'd'})
+        palette = mpl.colormaps['Set2'].colors
+        for i, patch in enumerate(boxes['boxes']):
+            patch.set_facecolor(palette[i % len(palette)])
     ax.set_ylim(point_map.Fantasy_Points.min(), point_map.Fantasy_Points.max())
     ax.set_ylabel('Fantasy Points')
     
@@ -219,7 +304,7 @@ def visualize_projections(proj_points, output):
 
 
     # add median value labels
-    medians = weighted_proj_points.median().values
+    medians = [box['med'] for box in stats]
     median_labels = [f'{val:.2f}' for val in medians]
     pos = range(len(medians))
     for tick,label in zip(pos,ax.get_xticklabels()):
@@ -227,12 +312,11 @@ def visualize_projections(proj_points, output):
                 horizontalalignment='center', size='x-small', color='black', weight='semibold')
     
     # add title
-    years = len(weighted_proj_points.columns)
+    years = len(stats)
     plt.title(f"Fantasy Points and Rank Projection for {target} over the next {years} seasons")
 
     # display the plot
     plt.show()
-    proj_points.drop(columns = 'Weight', inplace = True)
     proj_points = proj_points.replace(0.0, np.nan)
     
     summary = proj_points.describe(percentiles=[0.25, 0.5, 0.75])
@@ -244,27 +328,39 @@ def visualize_projections(proj_points, output):
 
 target = st.selectbox("Enter player name", options=unique_players)
 if st.button('Run Similarity Analysis'):
-    st.dataframe(season_df.loc[season_df.Player == target])
+    st.dataframe(season_df.take(player_rows[target]))
     st.write("Finding players who are most similar to", target)
     #Run Similarity Analysis
     #st.dataframe(find_peers(season_df = season_df, target = target))
 
     #Run Find Peers Function
-    df = season_df.copy()
-    target_df = df.loc[df.Player == target]
-    position = target_df.Pos.iloc[0]  
-    min_age = target_df.Age.min()
-    max_age = target_df.Age.max()
-    peer_df = df.loc[(df.Age >= min_age) & (df.Age <= max_age) & (df.Pos == position)] 
+    tgt_rows = player_rows[target]
+    ages = season_df['Age'].to_numpy()
+    position = season_df['Pos'].iloc[tgt_rows[0]]
+    min_age = ages[tgt_rows].min()
+    max_age = ages[tgt_rows].max()
+    peer_mask = (ages >= min_age) & (ages <= max_age) & (season_df['Pos'] == position).to_numpy()
+    peer_df = season_df.iloc[np.flatnonzero(peer_mask)]
 
     #Run the Fantasy Points abs. difference function
     peer_df = peer_df.drop_duplicates(subset = ['Player', 'Age'], keep='first')
-    peer_pivot = peer_df.pivot(index = 'Player', columns = 'Age', values = 'Fantasy_Points').dropna(axis=0)
-    reference_row = peer_pivot.loc[peer_pivot.index == target].iloc[0]
-    peer_fantasy = round(abs(peer_pivot.sub(reference_row) / reference_row),2)
-    peer_fantasy.columns = 'Age_' + peer_fantasy.columns.astype(int).astype(str)
-    peer_fantasy['Avg'] = round(peer_fantasy.mean(axis = 1),2)
-    peer_fantasy = peer_fantasy.loc[peer_fantasy.index != target]
+    #Scatter Fantasy Points into a players x ages matrix and keep players with every age
+    p_cat = pd.Categorical(peer_df['Player']).remove_unused_categories()
+    a_cat = pd.Categorical(peer_df['Age'])
+    M = np.full((len(p_cat.categories), len(a_cat.categories)), np.nan, dtype=np.float32)
+    M[p_cat.codes, a_cat.codes] = peer_df['Fantasy_Points'].to_numpy()
+    complete = ~np.isnan(M).any(axis=1)
+    vals = M[complete]
+    names = p_cat.categories[complete].rename('Player')
+
+    #Relative difference from the target's points at each age
+    is_target = np.asarray(names == target)
+    reference_row = vals[is_target][0]
+    #A 0 point season in the reference gives inf or NaN, skip NaN in the average as pandas did
+    with np.errstate(divide='ignore', invalid='ignore'):
+        arr = np.abs((vals[~is_target] - reference_row) / reference_row)
+    peer_fantasy = pd.DataFrame(arr, index = names[~is_target], columns = ['Age_' + str(int(a)) for a in a_cat.categories])
+    peer_fantasy['Avg'] = np.nanmean(arr, axis = 1)
     peer_fantasy.sort_values(by = 'Avg', ascending = True, inplace=True)
 
     euclid_df = euclid_compare(peer_df = peer_df, target = target)
@@ -273,68 +369,10 @@ if st.button('Run Similarity Analysis'):
     output_df = (peer_fantasy+euclid_df) / 2
     output_df.sort_values(by = 'Avg', ascending=True, inplace=True)
 
-    final_df = calculate_similarities(target, output_df, draft_df)
-    st.dataframe(final_df.head(5))
+    final_df = calculate_similarities(target, output_df, draft_df, draft_avg)
+    #Round for display only
+    st.dataframe(final_df.head(5).style.format("{:.2f}"))
 
     #Show Projection Visualizations
-    proj_points = projection_stats(target = target, output = final_df, season_df = season_df)
+    proj_points = projection_stats(target = target, output = final_df, season_df = season_df, player_rows = player_rows)
     visualize_projections(proj_points = proj_points, output = final_df)
-
-    output = final_df
-    zero_col = None
-    for col in proj_points.columns:
-        if (proj_points[col] == 0).sum() / len(proj_points) > 0.5:
-            zero_col = col
-            break
-
-    # Remove all columns to the right of the zero column
-    if zero_col is not None:
-        proj_points = proj_points.loc[:, :zero_col]
-
-    #Repeat the weights as row numbers
-    output2 = output.copy()
-    output2['Avg'] = 1 - output2['Avg']  # Assuming you want to transform the scores
-
-    # Ensure the index of 'output2' and 'proj_points' are aligned before assignment
-    proj_points = proj_points.loc[output2.index]  # This aligns 'proj_points' to the index of 'output2'
-    proj_points['Weight'] = output2['Avg']
-        
-    weighted_proj_points = proj_points.loc[np.repeat(proj_points.index.values, proj_points['Weight'])]
-    weighted_proj_points.drop(columns = 'Weight', inplace = True)
-    weighted_proj_points = weighted_proj_points[weighted_proj_points != 0]
-    
-    #Create Box Plot
-    point_map = point_bucket(target = target, season_df = season_df)
-    sns.set_style("whitegrid")
-    #ax = 
-    sns.boxplot(data=weighted_proj_points, palette="Set2")
-    ax = plt.gca()
-    ax.set_ylim(point_map.Fantasy_Points.min(), point_map.Fantasy_Points.max())
-    ax.set_ylabel('Fantasy Points')
-    
-    #Create Twin Axis for Ranking
-    ax2 = ax.twinx()
-    ax2.set_ylim(ax.get_ylim())
-    ax2.set_yticks(ax.get_yticks())
-    ax2.set_yticklabels(point_map['Avg_Rank'])
-    ax2.set_ylabel('Positional Rank')
-
-
-    # add median value labels
-    medians = weighted_proj_points.median().values
-    median_labels = [f'{val:.2f}' for val in medians]
-    pos = range(len(medians))
-    for tick,label in zip(pos,ax.get_xticklabels()):
-        ax.text(pos[tick], medians[tick] + 2.5, median_labels[tick], 
-                horizontalalignment='center', size='x-small', color='black', weight='semibold')
-    
-    # add title
-    years = len(weighted_proj_points.columns)
-    plt.title(f"Fantasy Points and Rank Projection for {target} over the next {years} seasons")
-    proj_points.drop(columns = 'Weight', inplace = True)
-    proj_points = proj_points.replace(0.0, np.nan)
-
-    # display the plot
-    plt.show()
-    
-    #summary = proj_points.describe(percentiles=[0.25, 0.5, 0.75])
\ No newline at end of file
@@ -0,0 +1,20 @@
+import numpy as np
+from numba import njit, prange
+
+
+##############################################################
+############### Compiled Similarity Kernels ##################
+##############################################################
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def euclid_block(X, Y, col):
+    #Euclidian Distance of every peer row in X from the target row Y[col[i]] of the same age
+    out = np.empty(X.shape[0], dtype=X.dtype)
+    for i in prange(X.shape[0]):
+        s = 0.0
+        for k in range(X.shape[1]):
+            d = X[i, k] - Y[col[i], k]
+            s += d*d
+        out[i] = np.sqrt(s)
+    return out